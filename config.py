@@ -2,50 +2,111 @@
 
 This module handles all configuration settings for the FaceFusion service,
 including path resolution, environment variable loading, and directory setup.
+Settings are resolved lazily, so processes only pay for the values they use.
 
 Typical usage example:
-    from config import UPLOAD_DIR, OUTPUT_DIR
-    uploaded_file = UPLOAD_DIR / "example.jpg"
+    from config import CONFIG
+    uploaded_file = CONFIG.UPLOAD_DIR / "example.jpg"
 """
 
-from typing import Union
+from typing import Any, Callable, Dict, Tuple, Union
 import os
 from pathlib import Path
 
 import dotenv
 
-# Load environment variables
-dotenv.load_dotenv()
+# Load environment variables once per process tree; child processes
+# inherit the already parsed values through the environment.
+_DOTENV_LOADED_KEY = "_FF_DOTENV_LOADED"
+
+if not os.environ.get(_DOTENV_LOADED_KEY):
+    dotenv.load_dotenv()
+    os.environ[_DOTENV_LOADED_KEY] = "1"
 
 # Type aliases
 PathLike = Union[str, Path]
 
-def _get_env_path(env_key: str, default: str) -> Path:
-    """Gets path from environment variable with default fallback.
-    
+# Base directory configuration
+BASE_DIR: Path = Path(__file__).resolve().parent
+
+def _resolve_path(value: str) -> Path:
+    """Resolves a configured path relative to the base directory.
+
     Args:
-        env_key: Environment variable key.
-        default: Default value if env var not set.
-    
+        value: Configured path value.
+
     Returns:
         Path object for the directory/file.
     """
-    return BASE_DIR / os.getenv(env_key, default)
+    return BASE_DIR / value
 
-# Base directory configuration
-BASE_DIR: Path = Path(__file__).resolve().parent
+def _resolve_dir(value: str) -> Path:
+    """Resolves a configured directory and ensures it exists.
+
+    Args:
+        value: Configured directory value.
+
+    Returns:
+        Path object for the created directory.
+    """
+    path = _resolve_path(value)
+    path.mkdir(exist_ok=True)
+    return path
+
+class _Config:
+    """Service configuration resolved lazily from environment variables.
+
+    Each setting is read from the environment on first access and memoized
+    on the instance. Storage directories are created when first accessed.
+    """
+
+    # Setting name -> (environment key, default value, parser)
+    _SETTINGS: Dict[str, Tuple[str, str, Callable[[str], Any]]] = {
+        "UPLOAD_DIR": ("UPLOAD_DIR", "uploads", _resolve_dir),
+        "OUTPUT_DIR": ("OUTPUT_DIR", "outputs", _resolve_dir),
+        "FACEFUSION_SCRIPT": ("FACEFUSION_PATH", "facefusion.py", _resolve_path),
+        "FACEFUSION_PATH": ("FACEFUSION_PATH", "facefusion.py", _resolve_path),
+        "SERVICE_HOST": ("SERVICE_HOST", "localhost", str),
+        "SERVICE_PORT": ("SERVICE_PORT", "8000", int),
+        "RAY_ADDRESS": ("RAY_ADDRESS", "auto", str),
+        "EXECUTION_PROVIDER": ("EXECUTION_PROVIDER", "cuda", str),
+        "ACTOR_POOL_SIZE": ("ACTOR_POOL_SIZE", "0", int),
+        "MAX_PENDING_TASKS_PER_ACTOR": ("MAX_PENDING_TASKS_PER_ACTOR", "8", int),
+    }
+
+    # Storage directories configuration
+    UPLOAD_DIR: Path
+    OUTPUT_DIR: Path
+    FACEFUSION_SCRIPT: Path
+    FACEFUSION_PATH: Path  # Alias of FACEFUSION_SCRIPT
+
+    # Service configuration
+    SERVICE_HOST: str
+    SERVICE_PORT: int
+    RAY_ADDRESS: str
+    EXECUTION_PROVIDER: str
+    ACTOR_POOL_SIZE: int  # 0 means one actor per GPU
+    MAX_PENDING_TASKS_PER_ACTOR: int  # Queued or running tasks per pool actor
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolves and memoizes a setting on first access.
+
+        Args:
+            name: Setting name.
+
+        Returns:
+            The parsed setting value.
 
-# Storage directories configuration
-UPLOAD_DIR: Path = _get_env_path("UPLOAD_DIR", "uploads")
-OUTPUT_DIR: Path = _get_env_path("OUTPUT_DIR", "outputs")
-FACEFUSION_SCRIPT: Path = _get_env_path("FACEFUSION_PATH", "facefusion.py")
+        Raises:
+            AttributeError: If the setting is unknown.
+        """
+        try:
+            env_key, default, parse = self._SETTINGS[name]
+        except KeyError:
+            raise AttributeError(f"Unknown setting: {name}") from None
 
-# Ensure required directories exist
-UPLOAD_DIR.mkdir(exist_ok=True)
-OUTPUT_DIR.mkdir(exist_ok=True)
+        value = parse(os.getenv(env_key, default))
+        self.__dict__[name] = value
+        return value
 
-# Service configuration
-SERVICE_HOST: str = os.getenv("SERVICE_HOST", "localhost")
-SERVICE_PORT: int = int(os.getenv("SERVICE_PORT", "8000"))
-RAY_ADDRESS: str = os.getenv("RAY_ADDRESS", "auto")
-EXECUTION_PROVIDER: str = os.getenv("EXECUTION_PROVIDER", "cuda")
\ No newline at end of file
+CONFIG = _Config()
@@ -0,0 +1,194 @@
+"""Ray actor dispatching FaceFusion tasks to the actor pool.
+
+This module provides a detached, named Ray actor owning the FaceFusion actor
+pool. Every service replica submits its tasks to it, so tasks are queued once
+for the whole deployment and keep running when the submitting replica is
+stopped by autoscaling. The number of queued and running tasks is bounded.
+
+Typical usage example:
+    dispatcher = get_dispatcher()
+    if await dispatcher.has_capacity.remote():
+        accepted = await dispatcher.submit.remote(
+            "123", "source.jpg", "target.jpg", "output.jpg", "cuda"
+        )
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Set
+
+import ray
+from ray.actor import ActorHandle
+
+from config import CONFIG
+from facefusion_actor import create_actor_pool
+from status_actor import get_status_actor
+
+# Module setup
+logger = logging.getLogger(__name__)
+
+DISPATCHER_ACTOR_NAME = "ff_dispatcher"
+
+
+@ray.remote(num_cpus=0)
+class DispatcherActor:
+    """Async Ray actor queueing tasks for the shared FaceFusion actor pool.
+
+    The pool is created here once, so placement groups and pool actors have
+    a single creator, and an actor is only idle when no replica is using it.
+    """
+
+    def __init__(self) -> None:
+        """Create the actor pool configured for the service."""
+        self._pool = create_actor_pool(CONFIG.ACTOR_POOL_SIZE or None)
+        self._status_actor = get_status_actor()
+        self._max_pending = max(CONFIG.MAX_PENDING_TASKS_PER_ACTOR, 1) * len(self._pool)
+        self._pending = 0
+        # Strong references keep running tasks from being garbage collected
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def has_capacity(self) -> bool:
+        """Checks whether a task submitted now would be queued.
+
+        Lets callers reject a task before storing its inputs. The answer is
+        not a reservation; submit may still reject the task.
+
+        Returns:
+            True if fewer tasks than the configured bound are pending.
+        """
+        return self._pending < self._max_pending
+
+    async def submit(
+        self,
+        task_id: str,
+        source_path: str,
+        target_path: str,
+        output_path: str,
+        execution_provider: str,
+        processors: Optional[List[str]] = None
+    ) -> bool:
+        """Registers a task and queues it for the next idle actor.
+
+        Returns once the task is registered with the status actor, so a
+        status poll on any replica finds it.
+
+        Args:
+            task_id: Unique identifier for the task.
+            source_path: Path to source face image.
+            target_path: Path to target image/video.
+            output_path: Path where result should be saved.
+            execution_provider: Backend for processing (cuda/cpu).
+            processors: FaceFusion processors to apply.
+
+        Returns:
+            True if the task was queued, False if too many tasks are pending.
+        """
+        if self._pending >= self._max_pending:
+            return False
+        # Reserved before awaiting, so concurrent submissions see the slot
+        self._pending += 1
+
+        try:
+            await self._status_actor.update.remote(
+                task_id,
+                "processing",
+                [
+                    f"Starting task {task_id}",
+                    f"Source: {source_path}",
+                    f"Target: {target_path}",
+                    f"Output: {output_path}"
+                ],
+                output_path
+            )
+        except Exception:
+            self._pending -= 1
+            raise
+
+        task = asyncio.get_running_loop().create_task(self._run(
+            task_id,
+            source_path,
+            target_path,
+            output_path,
+            execution_provider,
+            processors
+        ))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def shutdown(self) -> None:
+        """Shuts down the actor pool, abandoning queued and running tasks."""
+        self._pool.shutdown()
+
+    async def _run(
+        self,
+        task_id: str,
+        source_path: str,
+        target_path: str,
+        output_path: str,
+        execution_provider: str,
+        processors: Optional[List[str]]
+    ) -> None:
+        """Executes a task on the pool, recording errors as task failures.
+
+        The FaceFusion actor publishes the outcome of the task itself; only
+        errors raised instead of a result, such as a crashed actor, are
+        recorded here.
+
+        Args:
+            task_id: Unique identifier for the task.
+            source_path: Path to source face image.
+            target_path: Path to target image/video.
+            output_path: Path where result should be saved.
+            execution_provider: Backend for processing (cuda/cpu).
+            processors: FaceFusion processors to apply.
+        """
+        try:
+            await self._pool.process_face_fusion(
+                task_id,
+                source_path,
+                target_path,
+                output_path,
+                execution_provider,
+                processors
+            )
+
+        except Exception as e:
+            self._status_actor.update.remote(task_id, "failed", [f"Error: {str(e)}"])
+            logger.error("Error running face fusion actor task: %s", e, exc_info=True)
+
+        finally:
+            self._pending -= 1
+
+
+def get_dispatcher() -> ActorHandle:
+    """Returns the shared dispatcher actor, creating it if it does not exist.
+
+    A crashed dispatcher is restarted and binds to the existing pool again.
+    Tasks queued in the crashed dispatcher are lost; their status stays
+    "processing" until it expires after TASK_TTL.
+
+    Returns:
+        Handle of the detached dispatcher actor.
+    """
+    return DispatcherActor.options(
+        name=DISPATCHER_ACTOR_NAME,
+        lifetime="detached",
+        get_if_exists=True,
+        max_restarts=-1
+    ).remote()
+
+
+def shutdown_dispatcher() -> None:
+    """Shuts down the actor pool and kills the dispatcher if it exists.
+
+    The dispatcher, pool actors and their placement groups are detached, so
+    this is called when the service stops; otherwise they keep the GPUs
+    reserved and a redeployed service reuses their configuration.
+    """
+    try:
+        dispatcher = ray.get_actor(DISPATCHER_ACTOR_NAME)
+    except ValueError:
+        return
+    ray.get(dispatcher.shutdown.remote())
+    ray.kill(dispatcher, no_restart=True)
@@ -0,0 +1,351 @@
+"""Ray actor running FaceFusion in-process.
+
+This module provides a Ray actor that imports FaceFusion once and keeps its
+inference sessions resident for the lifetime of the actor, instead of
+spawning a fresh ``facefusion.py headless-run`` interpreter per task. The
+actor publishes the outcome and logs of each task to the status actor.
+
+Typical usage example:
+    pool = create_actor_pool()
+    error_code = await pool.process_face_fusion(
+        task_id="123",
+        source_path="source.jpg",
+        target_path="target.jpg",
+        output_path="output.jpg",
+        execution_provider="cuda"
+    )
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import ray
+from ray.actor import ActorHandle
+from ray.util.placement_group import PlacementGroup
+from ray.util.scheduling_strategies import PlacementGroupSchedulingStrategy
+
+from config import CONFIG
+from status_actor import MAX_TASK_LOG_LINES, get_status_actor
+
+# Module setup
+logger = logging.getLogger(__name__)
+
+# FaceFusion error code reported for failures outside its own pipeline
+ERROR_CODE_FAILED = 1
+
+# Pool actors are detached and named so every service replica shares them;
+# each one runs in its own placement group of a single bundle
+POOL_ACTOR_NAME_PREFIX = "ff_pool_"
+POOL_GPU_BUNDLE: Dict[str, float] = {"GPU": 1, "CPU": 2}
+POOL_CPU_BUNDLE: Dict[str, float] = {"CPU": 2}
+
+# Options passed to every FaceFusion run; the tolerant memory strategy keeps
+# inference sessions loaded between tasks.
+FACEFUSION_OPTIONS: Dict[str, str] = {
+    "--video-memory-strategy": "tolerant"
+}
+
+
+class _TaskLogHandler(logging.Handler):
+    """Logging handler buffering FaceFusion log lines of the running task."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: Deque[str] = deque(maxlen=MAX_TASK_LOG_LINES)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+@ray.remote(num_gpus=1, num_cpus=2, max_concurrency=1)
+class FaceFusionActor:
+    """Ray actor wrapping the FaceFusion headless pipeline.
+
+    FaceFusion keeps its loaded models in module level inference pools, so
+    running it inside a long-lived actor process amortizes model loading
+    across every task routed to the actor. FaceFusion state is global, so
+    the actor must process one task at a time.
+    """
+
+    def __init__(self) -> None:
+        """Import FaceFusion and build its argument parser once.
+
+        FaceFusion is imported from the checkout holding the configured
+        FACEFUSION_PATH script, which also becomes the working directory.
+        """
+        os.environ['OMP_NUM_THREADS'] = '1'
+        facefusion_dir = str(CONFIG.FACEFUSION_PATH.parent)
+        os.chdir(facefusion_dir)
+        if facefusion_dir not in sys.path:
+            sys.path.insert(0, facefusion_dir)
+
+        # Log records of this process never need thread or process details
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        from facefusion import core, logger as facefusion_logger, state_manager
+        from facefusion.args import apply_args
+        from facefusion.face_store import clear_reference_faces
+        from facefusion.program import create_program
+
+        self._core = core
+        self._state_manager = state_manager
+        self._apply_args = apply_args
+        self._clear_reference_faces = clear_reference_faces
+        self._program = create_program()
+        self._status_actor = get_status_actor()
+        self._argv_prefix: Tuple[str, ...] = (
+            "headless-run",
+            *(token for option in FACEFUSION_OPTIONS.items() for token in option)
+        )
+
+        facefusion_logger.init('info')
+        self._log_handler = _TaskLogHandler()
+        facefusion_logger.get_package_logger().addHandler(self._log_handler)
+        logger.info("FaceFusion actor initialized")
+
+    def process_face_fusion(
+        self,
+        task_id: str,
+        source_path: str,
+        target_path: str,
+        output_path: str,
+        execution_provider: str,
+        processors: Optional[List[str]] = None
+    ) -> int:
+        """Runs face fusion for a single task and publishes its outcome.
+
+        Args:
+            task_id: Unique identifier for the task.
+            source_path: Path to source face image.
+            target_path: Path to target image/video.
+            output_path: Path where result should be saved.
+            execution_provider: Backend for processing (cuda/cpu).
+            processors: FaceFusion processors to apply, e.g. face_swapper and
+                face_enhancer. Defaults to the FaceFusion configuration.
+
+        Returns:
+            FaceFusion error code, 0 on success.
+
+        Raises:
+            FileNotFoundError: If the source or target file does not exist.
+        """
+        # A single stat per input both validates it and provides its size
+        source_size = os.stat(source_path).st_size
+        target_size = os.stat(target_path).st_size
+        logger.info("Task %s: source %d bytes, target %d bytes", task_id, source_size, target_size)
+
+        argv: List[str] = [
+            *self._argv_prefix,
+            "-s", source_path,
+            "-t", target_path,
+            "-o", output_path,
+            "--execution-providers", execution_provider
+        ]
+        if processors:
+            argv.extend(("--processors", *processors))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Task %s: running facefusion %s", task_id, " ".join(argv))
+        logs = self._log_handler.lines = deque(maxlen=MAX_TASK_LOG_LINES)
+        error_code = self._run_facefusion(task_id, argv)
+
+        # Logs go straight to the status actor instead of through the caller
+        if error_code == 0:
+            logs.append("Task completed successfully")
+            self._status_actor.update.remote(task_id, "completed", list(logs))
+        else:
+            logs.append(f"Task failed with error code {error_code}")
+            self._status_actor.update.remote(task_id, "failed", list(logs))
+        return error_code
+
+    def _run_facefusion(self, task_id: str, argv: List[str]) -> int:
+        """Applies the arguments to FaceFusion state and processes them.
+
+        Args:
+            task_id: Unique identifier for the task.
+            argv: FaceFusion command line arguments.
+
+        Returns:
+            FaceFusion error code, 0 on success.
+        """
+        try:
+            args = vars(self._program.parse_args(argv))
+            self._apply_args(args, self._state_manager.init_item)
+            self._clear_reference_faces()
+
+            if self._core.common_pre_check() and self._core.processors_pre_check():
+                return self._core.conditional_process()
+            return 2
+
+        except SystemExit as e:
+            # FaceFusion calls sys.exit() on fatal errors, which must not
+            # take down the actor process.
+            logger.error("Task %s: facefusion exited with %s", task_id, e.code)
+            return e.code if isinstance(e.code, int) else ERROR_CODE_FAILED
+
+
+class FaceFusionActorPool:
+    """Pool of FaceFusion actors dispatching each task to an idle actor.
+
+    Unlike ``ray.util.ActorPool``, waiting for an idle actor is awaitable, so
+    callers on the dispatcher event loop are never blocked by the pool.
+    """
+
+    def __init__(
+        self,
+        actors: List[ActorHandle],
+        placement_groups: List[PlacementGroup]
+    ) -> None:
+        """Initialize the pool with every actor idle.
+
+        Args:
+            actors: FaceFusion actor handles to dispatch to.
+            placement_groups: Placement groups reserving the actor resources.
+        """
+        self._actors = actors
+        self._placement_groups = placement_groups
+        self._idle_actors: asyncio.Queue[ActorHandle] = asyncio.Queue()
+        for actor in actors:
+            self._idle_actors.put_nowait(actor)
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    async def process_face_fusion(
+        self,
+        task_id: str,
+        source_path: str,
+        target_path: str,
+        output_path: str,
+        execution_provider: str,
+        processors: Optional[List[str]] = None
+    ) -> int:
+        """Runs face fusion on the next idle actor.
+
+        Args:
+            task_id: Unique identifier for the task.
+            source_path: Path to source face image.
+            target_path: Path to target image/video.
+            output_path: Path where result should be saved.
+            execution_provider: Backend for processing (cuda/cpu).
+            processors: FaceFusion processors to apply.
+
+        Returns:
+            FaceFusion error code, 0 on success.
+        """
+        actor = await self._idle_actors.get()
+        try:
+            return await actor.process_face_fusion.remote(
+                task_id,
+                source_path,
+                target_path,
+                output_path,
+                execution_provider,
+                processors
+            )
+        finally:
+            self._idle_actors.put_nowait(actor)
+
+    def shutdown(self) -> None:
+        """Kills the pool actors and releases their placement groups.
+
+        Both are detached, so they keep their resources reserved after the
+        service stops unless the pool is shut down.
+        """
+        for actor in self._actors:
+            ray.kill(actor, no_restart=True)
+        for placement_group in self._placement_groups:
+            ray.util.remove_placement_group(placement_group)
+        logger.info("Shut down FaceFusion actor pool with %d actors", len(self._actors))
+
+
+def _get_placement_group(index: int, bundle: Dict[str, float]) -> PlacementGroup:
+    """Returns the detached placement group of a pool actor.
+
+    Args:
+        index: Index of the actor in the pool.
+        bundle: Resources reserved for the actor.
+
+    Returns:
+        The existing or newly created placement group.
+    """
+    name = f"{POOL_ACTOR_NAME_PREFIX}pg_{index}"
+    try:
+        return ray.util.get_placement_group(name)
+    except ValueError:
+        pass
+
+    try:
+        return ray.util.placement_group(
+            [bundle],
+            strategy="STRICT_PACK",
+            name=name,
+            lifetime="detached"
+        )
+    except Exception:
+        # Another process created the group since the lookup; the name is
+        # taken, so use that group
+        return ray.util.get_placement_group(name)
+
+
+def create_actor_pool(size: Optional[int] = None) -> FaceFusionActorPool:
+    """Creates a FaceFusion actor pool with one actor per GPU.
+
+    Each actor is pinned to the single bundle of its own placement group and
+    named after that group, so replicas creating a pool of the same size
+    bind to the same actors instead of loading models again.
+
+    Args:
+        size: Number of actors, defaults to the GPU count of the cluster.
+            Sizes outside 1 to the GPU count are clamped to that range.
+
+    Returns:
+        The created actor pool. Without GPUs a single CPU actor is used.
+    """
+    num_gpus = int(ray.cluster_resources().get("GPU", 0))
+    # Detached actors are never recreated by replicas, so a crashed actor is
+    # restarted by Ray in its placement group
+    actor_options: Dict[str, Any] = {
+        "lifetime": "detached",
+        "get_if_exists": True,
+        "max_restarts": -1
+    }
+    bundle = POOL_GPU_BUNDLE
+
+    if num_gpus == 0:
+        actor_options["num_gpus"] = 0
+        bundle = POOL_CPU_BUNDLE
+
+    # Every actor reserves a whole GPU; placement groups beyond the GPU
+    # count would never be scheduled
+    max_size = max(num_gpus, 1)
+    pool_size = min(max(size, 1), max_size) if size is not None else max_size
+    if size is not None and pool_size != size:
+        logger.warning(
+            "Adjusted FaceFusion actor pool size from %d to %d for %d GPUs",
+            size,
+            pool_size,
+            num_gpus
+        )
+
+    actors = []
+    placement_groups = []
+    for index in range(pool_size):
+        placement_group = _get_placement_group(index, bundle)
+        placement_groups.append(placement_group)
+        actors.append(FaceFusionActor.options(
+            name=f"{POOL_ACTOR_NAME_PREFIX}pg{placement_group.id.hex()[:8]}_bundle0",
+            scheduling_strategy=PlacementGroupSchedulingStrategy(
+                placement_group=placement_group,
+                placement_group_bundle_index=0
+            ),
+            **actor_options
+        ).remote())
+
+    logger.info("Using FaceFusion actor pool with %d actors", len(actors))
+    return FaceFusionActorPool(actors, placement_groups)
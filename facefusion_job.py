@@ -1,145 +1,143 @@
 """Ray job management module for FaceFusion tasks.
 
-This module handles the creation and management of Ray jobs for face fusion
-processing. It provides functionality for running face fusion tasks and
-tracking their status and logs.
+This module submits face fusion tasks to the shared dispatcher actor, which
+queues them for the FaceFusion actor pool. It provides functionality for
+running face fusion tasks and tracking their status and logs.
 
 Typical usage example:
     task_id = "123"
-    await run_facefusion_with_ray_job(
+    accepted = await run_facefusion_with_ray_job(
         task_id=task_id,
         source_path="source.jpg",
         target_path="target.jpg",
         output_path="output.jpg"
     )
-    status, logs = get_task_status(task_id)
+    status, output_path, logs = await get_task_status(task_id)
+    status, output_path = await wait_for_task_status(task_id, status, 15.0)
 """
 
-import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-import dotenv
+from ray.actor import ActorHandle
 
-from config import FACEFUSION_SCRIPT, EXECUTION_PROVIDER
+from config import CONFIG
+from dispatcher_actor import get_dispatcher, shutdown_dispatcher
+from status_actor import TaskStatus, get_status_actor, shutdown_status_actor
 
 # Module setup
 logger = logging.getLogger(__name__)
-dotenv.load_dotenv()
 
-# Task tracking state
-TaskStatus = str  # Type alias for task status strings
-tasks: Dict[str, TaskStatus] = {}
-task_logs: Dict[str, List[str]] = {}
+# Dispatcher and task status actors shared by all replicas, looked up on
+# first use
+_dispatcher: Optional[ActorHandle] = None
+_status_actor: Optional[ActorHandle] = None
+
+def _get_dispatcher() -> ActorHandle:
+    """Returns the shared task dispatcher actor."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = get_dispatcher()
+    return _dispatcher
+
+def _get_status_actor() -> ActorHandle:
+    """Returns the shared task status actor."""
+    global _status_actor
+    if _status_actor is None:
+        _status_actor = get_status_actor()
+    return _status_actor
+
+def connect_dispatcher() -> None:
+    """Looks up the shared dispatcher, creating it if it does not exist.
+
+    Called at startup, so the actor pool loads before the first task.
+    """
+    _get_dispatcher()
+
+def shutdown_service_actors() -> None:
+    """Tears down the dispatcher, actor pool and status actor.
+
+    They are detached and shared by all replicas, so they are only torn
+    down once the whole service has stopped.
+    """
+    global _dispatcher, _status_actor
+    shutdown_dispatcher()
+    shutdown_status_actor()
+    _dispatcher = _status_actor = None
+
+async def has_pool_capacity() -> bool:
+    """Checks whether the FaceFusion actor pool accepts new tasks.
+
+    Returns:
+        True if a task submitted now would be queued.
+    """
+    return await _get_dispatcher().has_capacity.remote()
 
 async def run_facefusion_with_ray_job(
     task_id: str,
     source_path: str,
     target_path: str,
     output_path: str,
-    execution_provider: str = EXECUTION_PROVIDER
-) -> None:
-    """Initiates a face fusion task using Ray job submission.
+    execution_provider: Optional[str] = None,
+    processors: Optional[List[str]] = None
+) -> bool:
+    """Submits a face fusion task to the FaceFusion actor pool.
 
     Args:
         task_id: Unique identifier for the task.
         source_path: Path to source face image.
         target_path: Path to target image/video.
         output_path: Path where result should be saved.
-        execution_provider: Backend for processing (cuda/cpu).
+        execution_provider: Backend for processing (cuda/cpu), defaults to
+            the configured execution provider.
+        processors: FaceFusion processors to apply, defaults to the
+            FaceFusion configuration.
 
-    Raises:
-        RuntimeError: If Ray job submission fails.
+    Returns:
+        True if the task was queued, False if the pool is at capacity.
     """
-    tasks[task_id] = "processing"
-    task_logs[task_id] = []
-    task_logs[task_id].append(f"Starting task {task_id}")
-    task_logs[task_id].append(f"Source: {source_path}")
-    task_logs[task_id].append(f"Target: {target_path}")
-    task_logs[task_id].append(f"Output: {output_path}")
-    
-    asyncio.create_task(_run_subprocess(task_id, source_path, target_path, output_path, execution_provider))
-
-async def _run_subprocess(
-    task_id: str,
-    source_path: str,
-    target_path: str,
-    output_path: str,
-    execution_provider: str
-) -> None:
-    """Executes the face fusion subprocess using Ray job submit.
+    execution_provider = execution_provider or CONFIG.EXECUTION_PROVIDER
+    # Returns once the task is registered, so a status poll on any replica
+    # finds it; the task itself keeps running if this replica stops
+    return await _get_dispatcher().submit.remote(
+        task_id,
+        source_path,
+        target_path,
+        output_path,
+        execution_provider,
+        processors
+    )
+
+async def get_task_status(task_id: str) -> Tuple[str, Optional[str], List[str]]:
+    """Retrieves the current status, output path and logs for a task.
 
     Args:
         task_id: Unique identifier for the task.
-        source_path: Path to source face image.
-        target_path: Path to target image/video.
-        output_path: Path where result should be saved.
-        execution_provider: Backend for processing (cuda/cpu).
+
+    Returns:
+        A tuple containing:
+        - Current task status (str): One of "processing", "completed", "failed", "not_found"
+        - Output path of the task (Optional[str])
+        - List of log messages (List[str])
     """
-    command = [
-        "ray", "job", "submit",
-        "--address=auto",
-        "--",
-        "python",
-        str(FACEFUSION_SCRIPT),
-        "headless-run",
-        "-s", source_path,
-        "-t", target_path,
-        "-o", output_path,
-        "--execution-provider", execution_provider
-    ]
-    
-    task_logs[task_id].append(f"Executing command: {' '.join(command)}")
-    
-    try:
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-
-        while True:
-            line = await process.stdout.readline()
-            if not line:
-                break
-            log_line = line.decode().strip()
-            task_logs[task_id].append(log_line)
-            logger.info(f"Task {task_id}: {log_line}")
-
-
-        stderr = await process.stderr.read()
-        if stderr:
-            error_lines = stderr.decode().strip().split('\n')
-            for error_line in error_lines:
-                task_logs[task_id].append(f"ERROR: {error_line}")
-                logger.error(f"Task {task_id} error: {error_line}")
-            
-        await process.wait()
-        if process.returncode == 0:
-            tasks[task_id] = "completed"
-            task_logs[task_id].append("Task completed successfully")
-        else:
-            tasks[task_id] = "failed"
-            task_logs[task_id].append(f"Task failed with return code {process.returncode}")
-            
-    except Exception as e:
-        tasks[task_id] = "failed"
-        task_logs[task_id].append(f"Error: {str(e)}")
-        logger.error(f"Error running subprocess: {e}", exc_info=True)
-
-def get_task_status(task_id: str) -> Tuple[str, List[str]]:
-    """Retrieves the current status and logs for a task.
+    return await _get_status_actor().get.remote(task_id)
+
+async def wait_for_task_status(
+    task_id: str,
+    status: Optional[TaskStatus],
+    timeout: float
+) -> Tuple[TaskStatus, Optional[str]]:
+    """Waits until the status of a task differs from a known status.
 
     Args:
         task_id: Unique identifier for the task.
+        status: Status last seen by the caller, None if none was seen.
+        timeout: Maximum number of seconds to wait.
 
     Returns:
         A tuple containing:
-        - Current task status (str): One of "processing", "completed", "failed", "not_found"
-        - List of log messages (List[str])
+        - Current task status (str), unchanged if the wait timed out
+        - Output path of the task (Optional[str])
     """
-    status = tasks.get(task_id, "not_found")
-    logs = task_logs.get(task_id, [])
-    return status, logs
\ No newline at end of file
+    return await _get_status_actor().wait.remote(task_id, status, timeout)
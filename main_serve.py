@@ -11,30 +11,45 @@ Typical usage example:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import logging
+import os
+import queue
+import re
+import secrets
+import shutil
+import signal
 import sys
 import threading
 import time
-import uuid
 from datetime import datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Sequence, Tuple
 
 import ray
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from ray import serve
 
-from config import (
-    OUTPUT_DIR,
-    UPLOAD_DIR,
-    RAY_ADDRESS,
-    SERVICE_HOST,
-    SERVICE_PORT
+from config import CONFIG
+from facefusion_job import (
+    run_facefusion_with_ray_job,
+    connect_dispatcher,
+    has_pool_capacity,
+    shutdown_service_actors,
+    get_task_status,
+    wait_for_task_status
+)
+from models import (
+    FACE_FUSION_RESPONSE_ADAPTER,
+    TASK_STATUS_ADAPTER,
+    FaceFusionResponse,
+    TaskStatus
 )
-from facefusion_job import run_facefusion_with_ray_job, get_task_status
-from models import FaceFusionResponse, TaskStatus
 
 # Constants
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -45,33 +60,84 @@ LOG_BACKUP_COUNT = 5
 CLEANUP_INTERVAL = 86400  # 1 day in seconds
 RETRY_INTERVAL = 3600    # 1 hour in seconds
 DEFAULT_CUTOFF_DAYS = 5
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+VIDEO_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # 4MB
+CLEANUP_STATE_FILE = ".cleanup_state"  # Stored in the output directory
+CLEANUP_ACTOR_NAME = "ff_cleanup"
+CLEANUP_CHECK_INTERVAL = 300  # Seconds between reads of the cleanup state
+FILE_SUFFIX_PATTERN = re.compile(r"\.[A-Za-z0-9]{1,5}$")
+EVENT_KEEPALIVE_INTERVAL = 15.0  # Seconds between keepalives on event streams
+# Open event streams per replica; each holds a status actor call slot, and
+# 16 replicas leave half of the status actor's slots for updates and reads
+MAX_EVENT_STREAMS = 32
+POOL_BUSY_RETRY_AFTER = 30  # Seconds clients should wait before resubmitting
+TASK_ID_BYTES = 16  # Random task IDs cannot be guessed or collide across pods
+FINAL_TASK_STATUSES = frozenset({"completed", "failed", "not_found"})
+
+# Health responses never change, so one response is built and reused
+HEALTH_RESPONSE = Response(b'{"status":"ok"}', media_type="application/json")
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-def setup_logging() -> None:
-    """Configure application-wide logging with file and console handlers."""
-    LOG_DIR.mkdir(exist_ok=True)
-    
+def setup_logging(log_file: Optional[Path] = LOG_FILE) -> None:
+    """Configure application-wide logging with file and console handlers.
+
+    Records are put on a queue and written by a background listener thread,
+    so logging callers never wait on file writes or log rotation.
+
+    Args:
+        log_file: Rotating log file, or None to log to the console only.
+    """
+    # LOG_FORMAT never uses thread or process details, so skip collecting
+    # them for every record. Set here rather than on import, since replicas
+    # unpickle the deployment without importing this module.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     formatter = logging.Formatter(LOG_FORMAT)
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    # Debug records are only built when the log file will keep them
+    root_logger.setLevel(logging.INFO if log_file is None else logging.DEBUG)
+    handlers: List[logging.Handler] = []
 
     # File handler
-    file_handler = RotatingFileHandler(
-        LOG_FILE,
-        maxBytes=MAX_LOG_SIZE,
-        backupCount=LOG_BACKUP_COUNT
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    if log_file is not None:
+        log_file.parent.mkdir(exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=MAX_LOG_SIZE,
+            backupCount=LOG_BACKUP_COUNT
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
+
+    # All handlers are driven by the listener thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+def pool_busy_error() -> HTTPException:
+    """Build the error answered while the actor pool is at capacity.
+
+    Returns:
+        HTTP 503 error telling the client when to retry.
+    """
+    return HTTPException(
+        status_code=503,
+        detail="All FaceFusion actors are busy, retry later",
+        headers={"Retry-After": str(POOL_BUSY_RETRY_AFTER)}
+    )
 
 class FileManager:
     """File operations manager for the FaceFusion service.
@@ -80,35 +146,134 @@ class FileManager:
     """
 
     @staticmethod
-    async def save_upload_file(upload_file: UploadFile, uid: str) -> Path:
+    def scan_upload_dir() -> int:
+        """Sum the size of every file in the upload directory.
+
+        Returns:
+            Total size of uploaded files in bytes.
+        """
+        with os.scandir(CONFIG.UPLOAD_DIR) as entries:
+            return sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            )
+
+    @staticmethod
+    def safe_suffix(filename: Optional[str]) -> str:
+        """Extract a safe file extension from a client supplied filename.
+
+        Args:
+            filename: Untrusted filename of the upload.
+
+        Returns:
+            Lowercase extension including the dot, or an empty string if the
+            filename has no short alphanumeric extension.
+        """
+        match = FILE_SUFFIX_PATTERN.search(filename or "")
+        return match.group(0).lower() if match else ""
+
+    @staticmethod
+    async def save_upload_file(
+        upload_file: UploadFile,
+        path_stem: str
+    ) -> Tuple[str, int]:
         """Save uploaded file with unique identifier.
 
         Args:
             upload_file: The uploaded file object.
-            uid: Unique identifier for the file.
+            path_stem: Path of the file without its extension.
 
         Returns:
-            Path to the saved file.
+            A tuple containing:
+            - Path of the saved file (str)
+            - Number of bytes written (int)
 
         Raises:
             HTTPException: If file saving fails.
         """
         try:
-            file_path = UPLOAD_DIR / f"{uid}_{upload_file.filename}"
-            content = await upload_file.read()
-            
-            file_path.write_bytes(content)
-            logger.info(f"Saved file: {file_path}")
+            # The client filename never reaches the filesystem, only its
+            # validated extension does.
+            suffix = FileManager.safe_suffix(upload_file.filename)
+            file_path = f"{path_stem}{suffix}"
+            size = await asyncio.to_thread(
+                FileManager._copy_upload_file, upload_file, file_path
+            )
+            logger.info("Saved file: %s", file_path)
             
-            return file_path
+            return file_path, size
             
         except Exception as e:
-            logger.error(f"File save error: {e}", exc_info=True)
+            logger.error("File save error: %s", e, exc_info=True)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to save file: {str(e)}"
             )
 
+    @staticmethod
+    def discard_uploads(file_paths: Sequence[str]) -> int:
+        """Remove the uploads of a task that was not accepted.
+
+        Args:
+            file_paths: Paths returned by save_upload_file.
+
+        Returns:
+            Number of bytes removed.
+        """
+        removed = 0
+        for file_path in file_paths:
+            try:
+                size = os.stat(file_path).st_size
+                os.unlink(file_path)
+                removed += size
+            except OSError as e:
+                logger.error("Failed to remove %s: %s", file_path, e)
+        return removed
+
+    @staticmethod
+    def _copy_upload_file(upload_file: UploadFile, file_path: str) -> int:
+        """Stream the spooled upload to disk in fixed-size chunks.
+
+        Args:
+            upload_file: The uploaded file object.
+            file_path: Destination path.
+
+        Returns:
+            Number of bytes written.
+        """
+        chunk_size = UPLOAD_CHUNK_SIZE
+        if (upload_file.content_type or "").startswith("video/"):
+            chunk_size = VIDEO_UPLOAD_CHUNK_SIZE
+
+        upload_file.file.seek(0)
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(upload_file.file, buffer, chunk_size)
+            return buffer.tell()
+
+    @staticmethod
+    def read_last_cleanup() -> float:
+        """Read the time of the last completed cleanup.
+
+        Returns:
+            Unix timestamp of the last cleanup, or 0 if none was recorded.
+        """
+        try:
+            state_path = CONFIG.OUTPUT_DIR / CLEANUP_STATE_FILE
+            return float(state_path.read_text())
+        except (OSError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def write_last_cleanup(timestamp: float) -> None:
+        """Record the time of a completed cleanup.
+
+        Args:
+            timestamp: Unix timestamp of the cleanup.
+        """
+        state_path = CONFIG.OUTPUT_DIR / CLEANUP_STATE_FILE
+        state_path.write_text(str(timestamp))
+
     @staticmethod
     def cleanup_old_files(cutoff_days: int = DEFAULT_CUTOFF_DAYS) -> None:
         """Remove files older than the cutoff period.
@@ -117,60 +282,166 @@ class FileManager:
             cutoff_days: Number of days after which files should be removed.
         """
         try:
-            cutoff = datetime.now() - timedelta(days=cutoff_days)
-            
-            for file_path in UPLOAD_DIR.iterdir():
-                if not file_path.is_file():
-                    continue
-                    
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if mtime < cutoff:
-                    try:
-                        file_path.unlink()
-                        logger.debug(f"Removed old file: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {file_path}: {e}")
+            cutoff_ts = (datetime.now() - timedelta(days=cutoff_days)).timestamp()
+
+            with os.scandir(CONFIG.UPLOAD_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime < cutoff_ts:
+                        try:
+                            os.unlink(entry.path)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Removed old file: %s", entry.path)
+                        except Exception as e:
+                            logger.error("Failed to remove %s: %s", entry.path, e)
                         
         except Exception as e:
-            logger.error(f"Cleanup error: {e}", exc_info=True)
+            logger.error("Cleanup error: %s", e, exc_info=True)
+
+@ray.remote(num_cpus=0)
+class CleanupCron:
+    """Detached Ray actor running the periodic upload cleanup.
+
+    The schedule lives outside the Serve replicas, so it survives replica
+    restarts and scale downs and cleanups never run on a serving replica.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the actor without starting the cleanup loop."""
+        self._loop_task: Optional[asyncio.Task[None]] = None
+
+    async def run(self) -> None:
+        """Start the cleanup loop unless it is already running."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(
+                self._cleanup_loop()
+            )
+
+    async def _cleanup_loop(self) -> None:
+        """Periodic cleanup task runner.
+
+        The time of the last cleanup is persisted, so actor restarts do not
+        postpone the next cleanup.
+        """
+        while True:
+            try:
+                last_cleanup = await asyncio.to_thread(FileManager.read_last_cleanup)
+                elapsed = time.time() - last_cleanup
+                if elapsed < CLEANUP_INTERVAL:
+                    await asyncio.sleep(CLEANUP_INTERVAL - elapsed)
+
+                await asyncio.to_thread(FileManager.cleanup_old_files)
+                await asyncio.to_thread(FileManager.write_last_cleanup, time.time())
+            except Exception as e:
+                logger.error("Cleanup error: %s", e)
+                await asyncio.sleep(RETRY_INTERVAL)
+
+def shutdown_cleanup_actor() -> None:
+    """Kill the detached cleanup actor if it exists."""
+    try:
+        cleanup_actor = ray.get_actor(CLEANUP_ACTOR_NAME)
+    except ValueError:
+        return
+    ray.kill(cleanup_actor, no_restart=True)
 
 @serve.deployment(
-    num_replicas=1,
+    autoscaling_config={
+        "min_replicas": 2,
+        "max_replicas": 16,
+        "target_num_ongoing_requests_per_replica": 8
+    },
+    max_concurrent_queries=32,
+    ray_actor_options={"num_cpus": 2},
     health_check_period_s=30,
     health_check_timeout_s=60,
     graceful_shutdown_wait_loop_s=120,
     graceful_shutdown_timeout_s=60
 )
-@serve.ingress(app := FastAPI(title="FaceFusion Service"))
+@serve.ingress(app := FastAPI(
+    title="FaceFusion Service",
+    default_response_class=ORJSONResponse
+))
 class FaceFusionService:
     """Ray Serve deployment for the FaceFusion service."""
 
     def __init__(self) -> None:
-        """Initialize service and start cleanup thread."""
-        self._cleanup_thread = threading.Thread(
-            target=self._cleanup_loop,
-            daemon=True,
-            name="CleanupThread"
-        )
-        self._cleanup_thread.start()
+        """Initialize service, bind to the dispatcher and start cleanup actor."""
+        # Ray captures and rotates replica output; a shared rotating file
+        # would be rotated concurrently by every replica
+        setup_logging(log_file=None)
+        connect_dispatcher()
+        self._event_streams = asyncio.Semaphore(MAX_EVENT_STREAMS)
+        # Storage directories ending in a separator, so request paths are
+        # built by concatenation instead of constructing Path objects
+        self._upload_prefix = os.path.join(CONFIG.UPLOAD_DIR, "")
+        self._output_prefix = os.path.join(CONFIG.OUTPUT_DIR, "")
+        # Running total of the upload directory size, maintained by uploads
+        # and resynchronized after cleanups. Kept per instance, since
+        # locks do not survive pickling the deployment class.
+        self._upload_bytes_lock = threading.Lock()
+        self._upload_bytes = 0
+        self._upload_bytes_synced_at = 0.0
+        self._cleanup_checked_at = 0.0
+        self._refresh_upload_dir_size()
+        # Every replica binds to the same detached actor; run() is idempotent
+        CleanupCron.options(
+            name=CLEANUP_ACTOR_NAME,
+            lifetime="detached",
+            get_if_exists=True
+        ).remote().run.remote()
         logger.info("Service initialized")
 
-    def _cleanup_loop(self) -> None:
-        """Periodic cleanup task runner."""
-        while True:
-            try:
-                FileManager.cleanup_old_files()
-                time.sleep(CLEANUP_INTERVAL)
-            except Exception as e:
-                logger.error(f"Cleanup error: {e}")
-                time.sleep(RETRY_INTERVAL)
+    def _add_upload_bytes(self, delta: int) -> None:
+        """Adjust the upload directory size counter.
+
+        Args:
+            delta: Number of bytes added (positive) or removed (negative).
+        """
+        with self._upload_bytes_lock:
+            self._upload_bytes += delta
+
+    def _refresh_upload_dir_size(self) -> int:
+        """Rescan the upload directory and reset the size counter.
+
+        Other replicas write to the same directory, so the counter is
+        resynchronized on startup and after every cleanup.
+
+        Returns:
+            Total size of uploaded files in bytes.
+        """
+        with self._upload_bytes_lock:
+            self._upload_bytes_synced_at = time.time()
+            self._upload_bytes = FileManager.scan_upload_dir()
+            return self._upload_bytes
+
+    def _get_upload_dir_size(self) -> int:
+        """Get the total size of the upload directory.
+
+        The size is maintained by uploads; the directory is only rescanned
+        if a cleanup ran since the last scan. The persisted cleanup time is
+        read at most once every CLEANUP_CHECK_INTERVAL seconds.
+
+        Returns:
+            Total size of uploaded files in bytes.
+        """
+        now = time.time()
+        if now - self._cleanup_checked_at >= CLEANUP_CHECK_INTERVAL:
+            self._cleanup_checked_at = now
+            if FileManager.read_last_cleanup() > self._upload_bytes_synced_at:
+                return self._refresh_upload_dir_size()
+
+        with self._upload_bytes_lock:
+            return self._upload_bytes
 
     @app.post("/swap", response_model=FaceFusionResponse)
     async def face_swap(
         self,
         source_image: UploadFile = File(...),
         target_image: UploadFile = File(...)
-    ) -> FaceFusionResponse:
+    ) -> Response:
         """Process face swap operation.
 
         Args:
@@ -178,107 +449,207 @@ class FaceFusionService:
             target_image: Target image/video.
 
         Returns:
-            FaceFusionResponse with task details.
+            Serialized FaceFusionResponse with task details.
 
         Raises:
-            HTTPException: If processing fails.
+            HTTPException: If processing fails, or with status 503 if the
+                actor pool has too many pending tasks.
         """
-        task_id = str(uuid.uuid4())
-        logger.info(f"Face swap task: {task_id}")
+        task_id = secrets.token_hex(TASK_ID_BYTES)
+        logger.info("Face swap task: %s", task_id)
 
         try:
-            source_path = await FileManager.save_upload_file(
-                source_image, f"{task_id}_source"
+            # Checked before storing the uploads; submitting still enforces
+            # the bound if other replicas filled the pool in the meantime
+            if not await has_pool_capacity():
+                raise pool_busy_error()
+
+            extension = FileManager.safe_suffix(target_image.filename)
+            output_path = f"{self._output_prefix}{task_id}_output{extension}"
+
+            (source_path, source_size), (target_path, target_size) = await asyncio.gather(
+                FileManager.save_upload_file(
+                    source_image, f"{self._upload_prefix}{task_id}_source"
+                ),
+                FileManager.save_upload_file(
+                    target_image, f"{self._upload_prefix}{task_id}_target"
+                )
             )
-            target_path = await FileManager.save_upload_file(
-                target_image, f"{task_id}_target"
-            )
-            
-            extension = Path(target_image.filename).suffix
-            output_path = OUTPUT_DIR / f"{task_id}_output{extension}"
+            self._add_upload_bytes(source_size + target_size)
 
-            await run_facefusion_with_ray_job(
+            accepted = await run_facefusion_with_ray_job(
                 task_id,
-                str(source_path),
-                str(target_path),
-                str(output_path)
+                source_path,
+                target_path,
+                output_path
             )
-
-            return FaceFusionResponse(
+            if not accepted:
+                removed = await asyncio.to_thread(
+                    FileManager.discard_uploads, [source_path, target_path]
+                )
+                self._add_upload_bytes(-removed)
+                raise pool_busy_error()
+
+            response = FaceFusionResponse(
                 task_id=task_id,
                 status="processing",
-                output_path=str(output_path)
+                output_path=output_path
+            )
+            # Returning a Response skips FastAPI's response model validation
+            return Response(
+                content=FACE_FUSION_RESPONSE_ADAPTER.dump_json(response),
+                media_type="application/json"
             )
 
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Face swap error: {e}", exc_info=True)
+            logger.error("Face swap error: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/status/{task_id}", response_model=TaskStatus)
-    async def get_status(self, task_id: str) -> TaskStatus:
+    async def get_status(self, task_id: str) -> Response:
         """Get task status.
 
         Args:
             task_id: Task identifier.
 
         Returns:
-            TaskStatus with current status and output path if completed.
+            Serialized TaskStatus with current status and output path if
+            completed.
 
         Raises:
             HTTPException: If status check fails.
         """
         try:
-            status, logs = get_task_status(task_id)
-            output_files = list(OUTPUT_DIR.glob(f"{task_id}_output.*"))
-            output_path = output_files[0] if output_files else None
+            status, output_path, logs = await get_task_status(task_id)
+            completed = (
+                status == "completed"
+                and output_path is not None
+                and os.path.exists(output_path)
+            )
 
-            return TaskStatus(
+            task_status = TaskStatus(
                 task_id=task_id,
                 status=status,
-                result=str(output_path) if status == "completed" and output_path else None,
+                result=output_path if completed else None,
                 logs=logs
             )
+            return Response(
+                content=TASK_STATUS_ADAPTER.dump_json(task_status),
+                media_type="application/json"
+            )
 
         except Exception as e:
-            logger.error(f"Status check error: {e}", exc_info=True)
+            logger.error("Status check error: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.get("/events/{task_id}")
+    async def task_events(self, task_id: str) -> StreamingResponse:
+        """Stream status changes of a task as server-sent events.
+
+        Each change is pushed as soon as the status actor records it, so
+        clients do not need to poll /status. The stream ends once the task
+        reaches a final status.
+
+        Args:
+            task_id: Task identifier.
+
+        Returns:
+            Event stream of JSON encoded task status changes.
+
+        Raises:
+            HTTPException: With status 503 if this replica already serves
+                MAX_EVENT_STREAMS streams.
+        """
+        if self._event_streams.locked():
+            raise HTTPException(
+                status_code=503,
+                detail="Too many open event streams, poll /status instead"
+            )
+        # Not locked, so this returns without suspending and nothing can
+        # take the slot between the check and the acquire; the stream
+        # releases it when it ends
+        await self._event_streams.acquire()
+        return StreamingResponse(
+            self._task_events(task_id),
+            media_type="text/event-stream"
+        )
+
+    async def _task_events(self, task_id: str) -> AsyncIterator[str]:
+        """Generate server-sent events for the status changes of a task.
+
+        Releases the event stream slot acquired by task_events when done.
+
+        Args:
+            task_id: Task identifier.
+
+        Yields:
+            Encoded events, and keepalive comments while nothing changes.
+        """
+        try:
+            status = None
+            while True:
+                try:
+                    current, output_path = await wait_for_task_status(
+                        task_id, status, EVENT_KEEPALIVE_INTERVAL
+                    )
+                except Exception as e:
+                    logger.error("Event stream error: %s", e, exc_info=True)
+                    return
+
+                if current == status:
+                    yield ": keepalive\n\n"
+                    continue
+
+                status = current
+                completed = (
+                    status == "completed"
+                    and output_path is not None
+                    and os.path.exists(output_path)
+                )
+                event = {
+                    "task_id": task_id,
+                    "status": status,
+                    "result": output_path if completed else None
+                }
+                yield f"data: {json.dumps(event)}\n\n"
+                if status in FINAL_TASK_STATUSES:
+                    return
+        finally:
+            self._event_streams.release()
+
     @app.get("/health")
-    async def health_check(self) -> Dict[str, str]:
+    async def health_check(self) -> Response:
         """Check service health status."""
-        return {"status": "ok"}
+        # Returned as is, skipping JSON encoding of a dict per probe
+        return HEALTH_RESPONSE
 
     @app.get("/stats")
     async def service_stats(self) -> Dict[str, int]:
         """Get service statistics."""
         try:
-            size_bytes = sum(
-                f.stat().st_size 
-                for f in UPLOAD_DIR.glob("*") 
-                if f.is_file()
-            )
+            # A resync after a cleanup scans the directory, keep it off the event loop
+            size_bytes = await asyncio.to_thread(self._get_upload_dir_size)
             return {"upload_dir_size": size_bytes}
         except Exception as e:
-            logger.error(f"Stats error: {e}", exc_info=True)
+            logger.error("Stats error: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
     try:
+        setup_logging()
         logger.info("Starting FaceFusion Service")
 
-        Path("logs").mkdir(exist_ok=True)
-        OUTPUT_DIR.mkdir(exist_ok=True)
-        UPLOAD_DIR.mkdir(exist_ok=True)
-
-        if RAY_ADDRESS:
-            logger.info(f"Connecting to Ray cluster at {RAY_ADDRESS}")
-            ray.init(address=RAY_ADDRESS)
+        if CONFIG.RAY_ADDRESS:
+            logger.info("Connecting to Ray cluster at %s", CONFIG.RAY_ADDRESS)
+            ray.init(address=CONFIG.RAY_ADDRESS)
         else:
             logger.info("Initializing Ray locally")
             ray.init()
 
         cluster_info = ray.cluster_resources()
-        logger.info(f"Ray cluster resources: {cluster_info}")
+        logger.info("Ray cluster resources: %s", cluster_info)
 
         logger.info("Starting Ray Serve")
         serve.start(
@@ -299,12 +670,18 @@ if __name__ == "__main__":
         logger.info("Service deployment completed successfully")
         logger.info("Service is running at http://0.0.0.0:9999/v1/model/facefusion")
 
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt, shutting down...")
+        stop_event = threading.Event()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, lambda *_: stop_event.set())
+        stop_event.wait()
+        logger.info("Received shutdown signal, shutting down...")
+
+        # Stop the replicas first, so no task is submitted during teardown
+        serve.shutdown()
+        shutdown_service_actors()
+        shutdown_cleanup_actor()
+        logger.info("Service shut down")
 
     except Exception as e:
-        logger.critical(f"Fatal error during service startup: {str(e)}", exc_info=True)
+        logger.critical("Fatal error during service startup: %s", e, exc_info=True)
         sys.exit(1)
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Data models for the FaceFusion API.
 
 This module defines Pydantic models used for request/response handling
-in the FaceFusion service API endpoints.
+in the FaceFusion service API endpoints, along with type adapters that
+serialize them without FastAPI re-validating the response.
 
 Typical usage example:
     response = FaceFusionResponse(
@@ -9,11 +10,12 @@ Typical usage example:
         status="processing",
         output_path="/path/to/output.jpg"
     )
+    content = FACE_FUSION_RESPONSE_ADAPTER.dump_json(response)
 """
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 class FaceFusionResponse(BaseModel):
     """Response model for face fusion operations.
@@ -32,6 +34,8 @@ class FaceFusionResponse(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task_id: str
     status: str
     output_path: Optional[str] = None
@@ -54,8 +58,14 @@ class TaskStatus(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task_id: str
     status: str
     result: Optional[str] = None
     logs: List[str] = []
 
+# Serializers built once at import
+FACE_FUSION_RESPONSE_ADAPTER = TypeAdapter(FaceFusionResponse)
+TASK_STATUS_ADAPTER = TypeAdapter(TaskStatus)
+
@@ -0,0 +1,174 @@
+"""Ray actor tracking the status of FaceFusion tasks.
+
+This module provides a detached, named Ray actor holding the status, output
+path and logs of every task, so all replicas of the service share one view
+of task state. FaceFusion actors publish task results to it directly, and
+status reads never queue behind an inference task.
+
+Typical usage example:
+    status_actor = get_status_actor()
+    status_actor.update.remote("123", "processing", ["Starting task 123"])
+    status, output_path, logs = await status_actor.get.remote("123")
+    status, output_path = await status_actor.wait.remote("123", status, 15.0)
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+import ray
+from cachetools import TTLCache
+from ray.actor import ActorHandle
+
+# Task tracking limits
+MAX_TRACKED_TASKS = 10000
+TASK_TTL = 86400  # 1 day in seconds
+STATUS_ACTOR_NAME = "ff_status"
+# Every open event stream holds one call slot while it waits for a change;
+# replicas cap their open streams so updates and reads always find a slot
+STATUS_ACTOR_MAX_CONCURRENCY = 1000
+
+# Log lines kept per task; per-frame progress of long videos is dropped
+# from the front beyond this
+MAX_TASK_LOG_LINES = 10000
+
+TaskStatus = str  # Type alias for task status strings
+
+
+@dataclass
+class TaskRecord:
+    """Tracked state of a face fusion task.
+
+    Attributes:
+        status: Current processing status.
+        output_path: Path where the result is written.
+        logs: Processing log messages, oldest dropped first.
+    """
+
+    status: TaskStatus
+    output_path: Optional[str] = None
+    logs: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_TASK_LOG_LINES))
+
+
+@ray.remote(num_cpus=0, max_concurrency=STATUS_ACTOR_MAX_CONCURRENCY)
+class StatusActor:
+    """Async Ray actor holding a size and age bounded registry of tasks.
+
+    Methods never await, so each call runs to completion on the actor's
+    event loop and the registry needs no locking.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty task registry."""
+        self._tasks: "TTLCache[str, TaskRecord]" = TTLCache(
+            maxsize=MAX_TRACKED_TASKS,
+            ttl=TASK_TTL
+        )
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    async def update(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        log_lines: List[str],
+        output_path: Optional[str] = None
+    ) -> None:
+        """Sets the status of a task and appends log lines to it.
+
+        Args:
+            task_id: Unique identifier for the task.
+            status: New task status.
+            log_lines: Log lines to append.
+            output_path: Path where the result is written, if known.
+        """
+        record = self._tasks.get(task_id) or TaskRecord(status)
+        record.status = status
+        if output_path is not None:
+            record.output_path = output_path
+        record.logs.extend(log_lines)
+        # Reassign so the entry's time to live restarts
+        self._tasks[task_id] = record
+
+        changed = self._changed.pop(task_id, None)
+        if changed is not None:
+            changed.set()
+
+    async def get(self, task_id: str) -> Tuple[TaskStatus, Optional[str], List[str]]:
+        """Retrieves the current status, output path and logs for a task.
+
+        Args:
+            task_id: Unique identifier for the task.
+
+        Returns:
+            A tuple containing:
+            - Current task status (str): One of "processing", "completed", "failed", "not_found"
+            - Output path of the task (Optional[str])
+            - List of log messages (List[str])
+        """
+        record = self._tasks.get(task_id)
+        if record is None:
+            return "not_found", None, []
+        return record.status, record.output_path, list(record.logs)
+
+    async def wait(
+        self,
+        task_id: str,
+        status: Optional[TaskStatus],
+        timeout: float
+    ) -> Tuple[TaskStatus, Optional[str]]:
+        """Waits until the status of a task differs from a known status.
+
+        Args:
+            task_id: Unique identifier for the task.
+            status: Status last seen by the caller, None if none was seen.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            A tuple containing:
+            - Current task status (str), unchanged if the wait timed out
+            - Output path of the task (Optional[str])
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            record = self._tasks.get(task_id)
+            current = record.status if record is not None else "not_found"
+            remaining = deadline - loop.time()
+            if current != status or remaining <= 0:
+                return current, record.output_path if record is not None else None
+
+            changed = self._changed.setdefault(task_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+
+def get_status_actor() -> ActorHandle:
+    """Returns the shared status actor, creating it if it does not exist.
+
+    Returns:
+        Handle of the detached status actor.
+    """
+    # Handles are cached by every replica and actor, so a crashed status
+    # actor is restarted under the same handle; task state is lost with it
+    return StatusActor.options(
+        name=STATUS_ACTOR_NAME,
+        lifetime="detached",
+        get_if_exists=True,
+        max_restarts=-1
+    ).remote()
+
+
+def shutdown_status_actor() -> None:
+    """Kills the shared status actor if it exists.
+
+    Detached actors outlive the service, so this is called when the service
+    stops.
+    """
+    try:
+        status_actor = ray.get_actor(STATUS_ACTOR_NAME)
+    except ValueError:
+        return
+    ray.kill(status_actor, no_restart=True)